@@ -1,24 +1,78 @@
+import json
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import requests
 
 EXE_DIR = Path(__file__).parent.parent
 SKILLS_DIR = EXE_DIR / "moltbook_skills"
+ETAGS_FILE = SKILLS_DIR / "skills.etags.json"
 
+URLS = [
+    ("https://www.moltbook.com/skill.md", "skill.md"),
+    ("https://www.moltbook.com/heartbeat.md", "heartbeat.md"),
+    ("https://www.moltbook.com/messaging.md", "messaging.md"),
+    ("https://www.moltbook.com/skill.json", "skill.json"),
+]
 
-def download_file(url: str, filename: str) -> None:
+
+def load_etags() -> dict[str, dict[str, str]]:
+    try:
+        return json.loads(ETAGS_FILE.read_text())
+    except (OSError, ValueError):
+        return {}
+
+
+def save_etags(etags: dict[str, dict[str, str]]) -> None:
+    # Write then rename so an interrupted run never leaves a truncated file
+    tmp_path = ETAGS_FILE.with_suffix(".tmp")
+    tmp_path.write_text(json.dumps(etags, indent=2, sort_keys=True) + "\n")
+    tmp_path.replace(ETAGS_FILE)
+
+
+def download_file(session: requests.Session, url: str, filename: str, etags: dict[str, dict[str, str]]) -> None:
     save_path = SKILLS_DIR / filename
     save_path.parent.mkdir(parents=True, exist_ok=True)  # create folders if needed
 
-    with requests.get(url, stream=True) as r:
+    # Only ask for a 304 when we still have the file it would refer to
+    headers = {}
+    cached = etags.get(filename, {}) if save_path.exists() else {}
+    if "etag" in cached:
+        headers["If-None-Match"] = cached["etag"]
+    if "last_modified" in cached:
+        headers["If-Modified-Since"] = cached["last_modified"]
+
+    with session.get(url, headers=headers, stream=True) as r:
+        if r.status_code == 304:
+            print(f"{filename}: up to date")
+            return
         r.raise_for_status()
-        with save_path.open("wb") as f:
+        # Stream to a partial file and rename it into place, so an interrupted
+        # run never leaves a truncated skill file behind
+        part_path = save_path.with_suffix(save_path.suffix + ".part")
+        with part_path.open("wb") as f:
             for chunk in r.iter_content(chunk_size=8192):
                 f.write(chunk)
+        part_path.replace(save_path)
+
+        validators = {}
+        if "ETag" in r.headers:
+            validators["etag"] = r.headers["ETag"]
+        if "Last-Modified" in r.headers:
+            validators["last_modified"] = r.headers["Last-Modified"]
+        etags[filename] = validators
+        print(f"{filename}: updated")
+
+
+def main() -> None:
+    etags = load_etags()
+    # Downloads are I/O bound, so threads sharing one session's pool overlap them
+    with requests.Session() as session, ThreadPoolExecutor(max_workers=len(URLS)) as executor:
+        futures = [executor.submit(download_file, session, url, filename, etags) for url, filename in URLS]
+        for future in futures:
+            future.result()  # re-raise any download error
+    save_etags(etags)
 
 
 if __name__ == "__main__":
-    download_file("https://www.moltbook.com/skill.md", "skill.md")
-    download_file("https://www.moltbook.com/heartbeat.md", "heartbeat.md")
-    download_file("https://www.moltbook.com/messaging.md", "messaging.md")
-    download_file("https://www.moltbook.com/skill.json", "skill.json")
+    main()
@@ -1,22 +1,114 @@
-import json
-import os
+from __future__ import annotations
 
+import functools
+import mimetypes
+import os
+import re
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import TYPE_CHECKING, Literal
+
+import orjson
 import requests
-from pydantic import BaseModel
-from rich.console import Console
-
-from .constants import BASE_URL, CONFIG_DIR, CONFIG_FILE
-from .models.auth import RegisterResponse, Status
-from .models.post import Feed, Post, PostComment
-
-
-def extract_id(input_str: str) -> str:
-    """Extract ID from a URL or return the ID as is."""
-    if input_str.startswith("http"):
-        for path_segment in ["/post/", "/comment/"]:
-            if path_segment in input_str:
-                return input_str.split(path_segment)[-1].split("?")[0].split("#")[0].rstrip("/")
-    return input_str
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from .constants import (
+    BASE_URL,
+    CACHE_MAXSIZE,
+    CACHE_TTL,
+    CONFIG_DIR,
+    CONFIG_FILE,
+    CommentSort,
+    SearchType,
+    SortOrder,
+)
+
+# Models and rich are only needed once a command runs, so keep them off the import path
+if TYPE_CHECKING:
+    from pydantic import BaseModel
+    from rich.console import Console
+
+    from .models.auth import RegisterResponse, Status
+    from .models.post import Feed, Post, PostComment, PostContent
+
+_ID_RES = {
+    "post": re.compile(r"/post/([^/?#]+)"),
+    "comment": re.compile(r"/comment/([^/?#]+)"),
+}
+
+
+def extract_id(input_str: str, kind: Literal["post", "comment"] = "post") -> str:
+    """Extract a post or comment ID from a URL or return the ID as is.
+
+    The kind decides which path segment is used, so a comment link nested under
+    its post yields the post ID for post commands and the comment ID for comment ones.
+    """
+    if not input_str.startswith("http"):
+        return input_str
+    match = _ID_RES[kind].search(input_str)
+    return match.group(1) if match else input_str
+
+
+# The sync client stays on requests: the retrying HTTPAdapter and the call sites
+# are built on it. HTTP/2 multiplexing is available through AsyncMoltbookAPI.
+_SESSION: requests.Session | None = None
+
+
+def _get_session() -> requests.Session:
+    """Return the process-wide session, creating it on first use."""
+    global _SESSION
+    if _SESSION is None:
+        _SESSION = requests.Session()
+        _SESSION.headers.update({"User-Agent": "moltbook-cli/0.0.1", "Connection": "keep-alive"})
+
+        # Larger pool so bursts of requests keep their sockets warm, and retry
+        # idempotent requests on transient failures
+        retry = Retry(
+            total=3,
+            backoff_factor=0.2,
+            status_forcelist=(429, 500, 502, 503, 504),
+            allowed_methods=frozenset({"GET", "HEAD"}),
+            raise_on_status=False,
+        )
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=32, max_retries=retry)
+        _SESSION.mount("https://", adapter)
+        _SESSION.mount("http://", adapter)
+    return _SESSION
+
+
+def _cached[F: Callable](method: F) -> F:
+    """Cache the result of a read-only API method for CACHE_TTL seconds."""
+
+    @functools.wraps(method)
+    def wrapper(self: MoltbookAPI, *args, **kwargs):
+        key = (method.__name__, args, tuple(sorted(kwargs.items())))
+        now = time.monotonic()
+        with self._cache_lock:
+            hit = self._cache.get(key)
+            generation = self._cache_generation
+        if hit is not None and hit[0] > now:
+            if self._verbose:
+                self.debug(f"Cache hit: {method.__name__}{args}")
+            return hit[1]
+
+        result = method(self, *args, **kwargs)
+        # The client may be shared across threads, so evict and insert under the lock
+        with self._cache_lock:
+            # A write invalidated the cache while this read was in flight, so the
+            # result may predate it; return it but don't keep it
+            if generation != self._cache_generation:
+                return result
+            if len(self._cache) >= CACHE_MAXSIZE:
+                # Evict the oldest entry; the lock keeps another thread from evicting it first
+                del self._cache[next(iter(self._cache))]
+            self._cache[key] = (now + CACHE_TTL, result)
+        return result
+
+    return wrapper  # pyright: ignore[reportReturnType]
 
 
 class MoltbookAPI:
@@ -24,20 +116,49 @@ class MoltbookAPI:
 
     api_key: str | None = None
     session: requests.Session
+    _base_url: str
+    _auth_headers: dict[str, str]
+    _safe_headers: dict[str, str]
+    _masked_key: str | None
+    _cache: dict[tuple, tuple[float, object]]
+    _cache_lock: threading.Lock
+    _cache_generation: int
     _verbose: bool = False
     console: Console
 
     def __init__(self, console: Console, api_key: str | None = None, verbose: bool = False):
         self.api_key = api_key or self._load_api_key()
-        self.session = requests.Session()
+        # The session is shared, so auth is sent per request instead of set on it
+        self.session = _get_session()
+        self._base_url = BASE_URL
         self.console = console
-        self.session.headers.update({"User-Agent": "moltbook-cli/0.0.1"})
+        self._auth_headers = {"Authorization": f"Bearer {self.api_key}"} if self.api_key else {}
+        self._cache = {}
+        self._cache_lock = threading.Lock()
+        self._cache_generation = 0
+
+        # Masked values for debug output, computed once
         if self.api_key:
-            self.session.headers.update({"Authorization": f"Bearer {self.api_key}"})
+            key = self.api_key
+            self._masked_key = f"{key[:8]}...{key[-4:]}" if len(key) > 12 else "****"
+            self._safe_headers = {**self.session.headers, "Authorization": "****"}
+        else:
+            self._masked_key = None
+            self._safe_headers = dict(self.session.headers)
 
         # Set verbose last to trigger the property setter if it's True
         self.verbose = verbose
 
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        """Close pooled connections. The shared session stays usable and reconnects on demand."""
+        self.session.close()
+
     @property
     def verbose(self) -> bool:
         return self._verbose
@@ -47,9 +168,8 @@ class MoltbookAPI:
         old_value = self._verbose
         self._verbose = value
         if value and not old_value:
-            if self.api_key:
-                masked_key = f"{self.api_key[:8]}...{self.api_key[-4:]}" if len(self.api_key) > 12 else "****"
-                self.console.print(f"[info]Debug: Using API Key: {masked_key}[/info]")
+            if self._masked_key:
+                self.console.print(f"[info]Debug: Using API Key: {self._masked_key}[/info]")
             else:
                 self.console.print("[warning]Debug: No API Key found[/warning]")
 
@@ -58,109 +178,97 @@ class MoltbookAPI:
         if self.verbose:
             self.console.print(f"[info]Debug: {message}[/info]")
 
-    def _load_api_key(self) -> str | None:
+    @staticmethod
+    def _load_api_key() -> str | None:
         """Load API key from environment variable or config file."""
         # Prefer environment variable over config file
         env_api_key = os.getenv("MOLTBOOK_API_KEY")
         if env_api_key:
             return env_api_key
 
-        if CONFIG_FILE.exists():
-            try:
-                with open(CONFIG_FILE, "r") as f:
-                    config = json.load(f)
-                    return config.get("api_key")
-            except (json.JSONDecodeError, IOError):
-                return None
-        return None
+        # A single read avoids a separate exists() check racing with the open
+        try:
+            config = orjson.loads(CONFIG_FILE.read_bytes())
+        except (OSError, ValueError):
+            return None
+        return config.get("api_key")
 
     def _save_config(self, api_key: str, agent_name: str):
         """Save API key and agent name to config file."""
         CONFIG_DIR.mkdir(parents=True, exist_ok=True)
         config = {"api_key": api_key, "agent_name": agent_name}
-        with open(CONFIG_FILE, "w") as f:
-            json.dump(config, f, indent=2, ensure_ascii=False)
+        CONFIG_FILE.write_bytes(orjson.dumps(config, option=orjson.OPT_INDENT_2))
 
-    def _request[T: BaseModel](self, Cls: type[T], method: str, endpoint: str, **kwargs) -> T:
-        """Make an API request."""
-        url = f"{BASE_URL}{endpoint}"
+    def _invalidate_cache(self):
+        """Drop cached reads and make any read still in flight skip caching its result."""
+        with self._cache_lock:
+            self._cache.clear()
+            self._cache_generation += 1
 
-        if "json" in kwargs:
-            self.session.headers["Content-Type"] = "application/json"
+    def _send(self, method: str, endpoint: str, **kwargs) -> requests.Response:
+        """Make an API request and translate HTTP errors."""
+        url = self._base_url + endpoint
 
-        self.debug(f"{method} {url}")
-        if "json" in kwargs:
-            self.debug(f"Payload: {kwargs['json']}")
+        # Any write may change what the cached reads would return
+        if method != "GET":
+            self._invalidate_cache()
 
-        # Mask Authorization header in debug output
-        headers = dict(self.session.headers)
-        if "Authorization" in headers:
-            auth = headers["Authorization"]
-            if auth.startswith("Bearer"):  # pyright: ignore[reportArgumentType]
-                headers["Authorization"] = "****"
-        self.debug(f"Headers: {headers}")
+        extra_headers = kwargs.get("headers", {})
+        kwargs["headers"] = {**self._auth_headers, **extra_headers}
+
+        # Only build debug output when it will actually be printed
+        if self._verbose:
+            self.debug(f"{method} {url}")
+            if "json" in kwargs:
+                self.debug(f"Payload: {kwargs['json']}")
+            headers = {**self._safe_headers, **extra_headers} if extra_headers else self._safe_headers
+            self.debug(f"Headers: {headers}")
 
         try:
             response = self.session.request(method, url, **kwargs)
-            self.debug(f"Response Status: {response.status_code}")
+            if method != "GET":
+                # Reads that started while the write was in flight may have cached older data
+                self._invalidate_cache()
+            if self._verbose:
+                self.debug(f"Response Status: {response.status_code}")
             response.raise_for_status()
-            return Cls.model_validate_json(response.text)
+            return response
 
         except requests.exceptions.RequestException as e:
             if hasattr(e, "response") and e.response is not None:
                 try:
-                    error_data = e.response.json()
+                    error_data = orjson.loads(e.response.content)
                     error_msg = error_data.get("error", str(e))
                     hint = error_data.get("hint", "")
                     if hint:
                         error_msg += f"\n[info]Hint: {hint}[/info]"
                     raise Exception(error_msg) from e
-                except json.JSONDecodeError:
+                except orjson.JSONDecodeError:
                     self.debug(f"Raw Error Response: {e.response.text}")
                     raise Exception(f"Request failed with status {e.response.status_code}") from e
             raise Exception(f"Request failed: {e}") from e
 
-    def _request_raw(self, method: str, endpoint: str, **kwargs) -> str:
+    def _request[T: BaseModel](self, Cls: type[T], method: str, endpoint: str, **kwargs) -> T:
         """Make an API request."""
-        url = f"{BASE_URL}{endpoint}"
-
-        if "json" in kwargs:
-            self.session.headers["Content-Type"] = "application/json"
+        return Cls.model_validate_json(self._send(method, endpoint, **kwargs).content)
 
-        self.debug(f"{method} {url}")
-        if "json" in kwargs:
-            self.debug(f"Payload: {kwargs['json']}")
+    def _request_raw(self, method: str, endpoint: str, **kwargs) -> bytes:
+        """Make an API request and return the undecoded response body."""
+        return self._send(method, endpoint, **kwargs).content
 
-        # Mask Authorization header in debug output
-        headers = dict(self.session.headers)
-        if "Authorization" in headers:
-            auth = headers["Authorization"]
-            if auth.startswith("Bearer"):  # pyright: ignore[reportArgumentType]
-                headers["Authorization"] = "****"
-        self.debug(f"Headers: {headers}")
-
-        try:
-            response = self.session.request(method, url, **kwargs)
-            self.debug(f"Response Status: {response.status_code}")
-            response.raise_for_status()
-            return response.text
+    def _upload(self, endpoint: str, file_path: str, fields: dict[str, str] | None = None) -> bytes:
+        """Upload a file as multipart form data, streaming it from disk."""
+        from requests_toolbelt.multipart.encoder import MultipartEncoder
 
-        except requests.exceptions.RequestException as e:
-            if hasattr(e, "response") and e.response is not None:
-                try:
-                    error_data = e.response.json()
-                    error_msg = error_data.get("error", str(e))
-                    hint = error_data.get("hint", "")
-                    if hint:
-                        error_msg += f"\n[info]Hint: {hint}[/info]"
-                    raise Exception(error_msg) from e
-                except json.JSONDecodeError:
-                    self.debug(f"Raw Error Response: {e.response.text}")
-                    raise Exception(f"Request failed with status {e.response.status_code}") from e
-            raise Exception(f"Request failed: {e}") from e
+        content_type = mimetypes.guess_type(file_path)[0] or "application/octet-stream"
+        with open(file_path, "rb") as f:
+            encoder = MultipartEncoder(fields={**(fields or {}), "file": (Path(file_path).name, f, content_type)})
+            return self._request_raw("POST", endpoint, data=encoder, headers={"Content-Type": encoder.content_type})
 
     # Registration
     def register(self, name: str, description: str) -> RegisterResponse:
+        from .models.auth import RegisterResponse
+
         return self._request(
             RegisterResponse,
             "POST",
@@ -169,6 +277,8 @@ class MoltbookAPI:
         )
 
     def check_status(self) -> Status:
+        from .models.auth import Status
+
         return self._request(Status, "GET", "/agents/status")
 
     # Posts
@@ -178,7 +288,7 @@ class MoltbookAPI:
         title: str,
         content: str | None = None,
         url: str | None = None,
-    ) -> str:
+    ) -> bytes:
         data = {"submolt": submolt, "title": title}
         if content:
             data["content"] = content
@@ -186,86 +296,126 @@ class MoltbookAPI:
             data["url"] = url
         return self._request_raw("POST", "/posts", json=data)
 
-    def get_feed(self, sort: str = "hot", limit: int = 25, submolt: str | None = None) -> Feed:
+    @_cached
+    def get_feed(self, sort: SortOrder = "hot", limit: int = 25, submolt: str | None = None) -> Feed:
+        from .models.post import Feed
+
         params = {"sort": sort, "limit": limit}
         if submolt:
             params["submolt"] = submolt
         return self._request(Feed, "GET", "/posts", params=params)
 
+    @_cached
+    def get_feed_raw(self, sort: SortOrder = "hot", limit: int = 25, submolt: str | None = None) -> bytes:
+        """Get the feed as the undecoded response body, for callers that only print it."""
+        params = {"sort": sort, "limit": limit}
+        if submolt:
+            params["submolt"] = submolt
+        return self._request_raw("GET", "/posts", params=params)
+
+    @_cached
     def get_post(self, post_id: str) -> Post:
+        from .models.post import Post
+
         post_id = extract_id(post_id)
         return self._request(Post, "GET", f"/posts/{post_id}")
 
-    def delete_post(self, post_id: str) -> str:
+    def delete_post(self, post_id: str) -> bytes:
         post_id = extract_id(post_id)
         return self._request_raw("DELETE", f"/posts/{post_id}")
 
     # Comments
-    def add_comment(self, post_id: str, content: str, parent_id: str | None = None) -> str:
+    def add_comment(self, post_id: str, content: str, parent_id: str | None = None) -> bytes:
         post_id = extract_id(post_id)
         data = {"content": content}
         if parent_id:
-            data["parent_id"] = extract_id(parent_id)
+            data["parent_id"] = extract_id(parent_id, kind="comment")
         return self._request_raw("POST", f"/posts/{post_id}/comments", json=data)
 
-    def get_comments(self, post_id: str, sort: str = "top") -> PostComment:
+    def get_comments(self, post_id: str, sort: CommentSort = "top") -> PostComment:
+        from .models.post import PostComment
+
         post_id = extract_id(post_id)
         return self._request(PostComment, "GET", f"/posts/{post_id}/comments", params={"sort": sort})
 
+    def get_feed_with_comments(
+        self,
+        sort: SortOrder = "hot",
+        limit: int = 25,
+        submolt: str | None = None,
+        concurrency: int = 5,
+    ) -> list[tuple[PostContent, PostComment]]:
+        """Get a feed along with the comments of every post, fetching comments in parallel."""
+        feed = self.get_feed(sort, limit, submolt)
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            comments = executor.map(lambda post: self.get_comments(post.id), feed.posts)
+            return list(zip(feed.posts, comments))
+
     # Voting
-    def upvote_post(self, post_id: str) -> str:
+    def upvote_post(self, post_id: str) -> bytes:
         post_id = extract_id(post_id)
         return self._request_raw("POST", f"/posts/{post_id}/upvote")
 
-    def downvote_post(self, post_id: str) -> str:
+    def downvote_post(self, post_id: str) -> bytes:
         post_id = extract_id(post_id)
         return self._request_raw("POST", f"/posts/{post_id}/downvote")
 
-    def upvote_comment(self, comment_id: str) -> str:
-        comment_id = extract_id(comment_id)
+    def upvote_comment(self, comment_id: str) -> bytes:
+        comment_id = extract_id(comment_id, kind="comment")
         return self._request_raw("POST", f"/comments/{comment_id}/upvote")
 
     # Submolts
-    def create_submolt(self, name: str, display_name: str, description: str) -> str:
+    def create_submolt(self, name: str, display_name: str, description: str) -> bytes:
         data = {"name": name, "display_name": display_name, "description": description}
         return self._request_raw("POST", "/submolts", json=data)
 
-    def list_submolts(self) -> str:
+    @_cached
+    def list_submolts(self) -> bytes:
         return self._request_raw("GET", "/submolts")
 
-    def get_submolt(self, name: str) -> str:
+    @_cached
+    def get_submolt(self, name: str) -> bytes:
         return self._request_raw("GET", f"/submolts/{name}")
 
-    def subscribe_submolt(self, name: str) -> str:
+    def subscribe_submolt(self, name: str) -> bytes:
         return self._request_raw("POST", f"/submolts/{name}/subscribe")
 
-    def unsubscribe_submolt(self, name: str) -> str:
+    def unsubscribe_submolt(self, name: str) -> bytes:
         return self._request_raw("DELETE", f"/submolts/{name}/subscribe")
 
     # Following
-    def follow_molty(self, agent_name: str) -> str:
+    def follow_molty(self, agent_name: str) -> bytes:
         return self._request_raw("POST", f"/agents/{agent_name}/follow")
 
-    def unfollow_molty(self, agent_name: str) -> str:
+    def unfollow_molty(self, agent_name: str) -> bytes:
         return self._request_raw("DELETE", f"/agents/{agent_name}/follow")
 
     # Feed
-    def get_personalized_feed(self, sort: str = "hot", limit: int = 25) -> Feed:
+    @_cached
+    def get_personalized_feed(self, sort: SortOrder = "hot", limit: int = 25) -> Feed:
+        from .models.post import Feed
+
         return self._request(Feed, "GET", "/feed", params={"sort": sort, "limit": limit})
 
+    @_cached
+    def get_personalized_feed_raw(self, sort: SortOrder = "hot", limit: int = 25) -> bytes:
+        """Get the personalized feed as the undecoded response body."""
+        return self._request_raw("GET", "/feed", params={"sort": sort, "limit": limit})
+
     # Search
-    def search(self, query: str, search_type: str = "all", limit: int = 20) -> str:
+    def search(self, query: str, search_type: SearchType = "all", limit: int = 20) -> bytes:
         params = {"q": query, "type": search_type, "limit": limit}
         return self._request_raw("GET", "/search", params=params)
 
     # Profile
-    def get_profile(self) -> str:
+    def get_profile(self) -> bytes:
         return self._request_raw("GET", "/agents/me")
 
-    def get_agent_profile(self, agent_name: str) -> str:
+    @_cached
+    def get_agent_profile(self, agent_name: str) -> bytes:
         return self._request_raw("GET", "/agents/profile", params={"name": agent_name})
 
-    def update_profile(self, description: str | None = None, metadata: str | None = None) -> str:
+    def update_profile(self, description: str | None = None, metadata: str | None = None) -> bytes:
         data = {}
         if description:
             data["description"] = description
@@ -273,19 +423,18 @@ class MoltbookAPI:
             data["metadata"] = metadata
         return self._request_raw("PATCH", "/agents/me", json=data)
 
-    def upload_avatar(self, file_path: str) -> str:
-        with open(file_path, "rb") as f:
-            return self._request_raw("POST", "/agents/me/avatar", files={"file": f})
+    def upload_avatar(self, file_path: str) -> bytes:
+        return self._upload("/agents/me/avatar", file_path)
 
-    def remove_avatar(self) -> str:
+    def remove_avatar(self) -> bytes:
         return self._request_raw("DELETE", "/agents/me/avatar")
 
     # Moderation
-    def pin_post(self, post_id: str) -> str:
+    def pin_post(self, post_id: str) -> bytes:
         post_id = extract_id(post_id)
         return self._request_raw("POST", f"/posts/{post_id}/pin")
 
-    def unpin_post(self, post_id: str) -> str:
+    def unpin_post(self, post_id: str) -> bytes:
         post_id = extract_id(post_id)
         return self._request_raw("DELETE", f"/posts/{post_id}/pin")
 
@@ -295,7 +444,7 @@ class MoltbookAPI:
         description: str | None = None,
         banner_color: str | None = None,
         theme_color: str | None = None,
-    ) -> str:
+    ) -> bytes:
         data = {}
         if description:
             data["description"] = description
@@ -305,63 +454,51 @@ class MoltbookAPI:
             data["theme_color"] = theme_color
         return self._request_raw("PATCH", f"/submolts/{submolt_name}/settings", json=data)
 
-    def upload_submolt_avatar(self, submolt_name: str, file_path: str) -> str:
-        with open(file_path, "rb") as f:
-            return self._request_raw(
-                "POST",
-                f"/submolts/{submolt_name}/settings",
-                files={"file": f},
-                data={"type": "avatar"},
-            )
-
-    def upload_submolt_banner(self, submolt_name: str, file_path: str) -> str:
-        with open(file_path, "rb") as f:
-            return self._request_raw(
-                "POST",
-                f"/submolts/{submolt_name}/settings",
-                files={"file": f},
-                data={"type": "banner"},
-            )
-
-    def add_moderator(self, submolt_name: str, agent_name: str) -> str:
+    def upload_submolt_avatar(self, submolt_name: str, file_path: str) -> bytes:
+        return self._upload(f"/submolts/{submolt_name}/settings", file_path, {"type": "avatar"})
+
+    def upload_submolt_banner(self, submolt_name: str, file_path: str) -> bytes:
+        return self._upload(f"/submolts/{submolt_name}/settings", file_path, {"type": "banner"})
+
+    def add_moderator(self, submolt_name: str, agent_name: str) -> bytes:
         return self._request_raw(
             "POST",
             f"/submolts/{submolt_name}/moderators",
             json={"agent_name": agent_name, "role": "moderator"},
         )
 
-    def remove_moderator(self, submolt_name: str, agent_name: str) -> str:
+    def remove_moderator(self, submolt_name: str, agent_name: str) -> bytes:
         return self._request_raw(
             "DELETE",
             f"/submolts/{submolt_name}/moderators",
             json={"agent_name": agent_name},
         )
 
-    def list_moderators(self, submolt_name: str) -> str:
+    def list_moderators(self, submolt_name: str) -> bytes:
         return self._request_raw("GET", f"/submolts/{submolt_name}/moderators")
 
     # DMs
-    def check_dms(self) -> str:
+    def check_dms(self) -> bytes:
         return self._request_raw("GET", "/agents/dm/check")
 
-    def list_dm_requests(self) -> str:
+    def list_dm_requests(self) -> bytes:
         return self._request_raw("GET", "/agents/dm/requests")
 
-    def approve_dm_request(self, conversation_id: str) -> str:
+    def approve_dm_request(self, conversation_id: str) -> bytes:
         return self._request_raw("POST", f"/agents/dm/requests/{conversation_id}/approve")
 
-    def list_conversations(self) -> str:
+    def list_conversations(self) -> bytes:
         return self._request_raw("GET", "/agents/dm/conversations")
 
-    def get_conversation(self, conversation_id: str) -> str:
+    def get_conversation(self, conversation_id: str) -> bytes:
         return self._request_raw("GET", f"/agents/dm/conversations/{conversation_id}")
 
-    def send_dm(self, conversation_id: str, message: str) -> str:
+    def send_dm(self, conversation_id: str, message: str) -> bytes:
         return self._request_raw(
             "POST",
             f"/agents/dm/conversations/{conversation_id}/send",
             json={"message": message},
         )
 
-    def request_dm(self, to_agent: str, message: str) -> str:
+    def request_dm(self, to_agent: str, message: str) -> bytes:
         return self._request_raw("POST", "/agents/dm/request", json={"to": to_agent, "message": message})
@@ -0,0 +1,329 @@
+import asyncio
+import mimetypes
+from pathlib import Path
+
+import httpx
+import orjson
+from pydantic import BaseModel
+from rich.console import Console
+
+from .api import MoltbookAPI, extract_id
+from .constants import BASE_URL, CommentSort, SearchType, SortOrder
+from .models.auth import RegisterResponse, Status
+from .models.post import Feed, Post, PostComment, PostContent
+
+
+class AsyncMoltbookAPI:
+    """Async API client for Moltbook.
+
+    Requires the ``async`` extra. Use it as an async context manager so the
+    underlying connection pool is opened once and closed deterministically:
+
+        async with AsyncMoltbookAPI(console) as api:
+            posts = await asyncio.gather(*(api.get_post(i) for i in ids))
+    """
+
+    api_key: str | None = None
+    verbose: bool = False
+    console: Console
+    _client: httpx.AsyncClient | None = None
+
+    def __init__(self, console: Console, api_key: str | None = None, verbose: bool = False):
+        self.api_key = api_key or MoltbookAPI._load_api_key()
+        self.console = console
+        self.verbose = verbose
+
+    async def __aenter__(self):
+        headers = {"User-Agent": "moltbook-cli/0.0.1"}
+        if self.api_key:
+            headers["Authorization"] = f"Bearer {self.api_key}"
+        self._client = httpx.AsyncClient(
+            base_url=BASE_URL,
+            headers=headers,
+            http2=True,
+            limits=httpx.Limits(max_keepalive_connections=32),
+        )
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.aclose()
+
+    async def aclose(self):
+        """Close the underlying connection pool."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    def debug(self, message: str):
+        """Print a debug message if verbose is enabled."""
+        if self.verbose:
+            self.console.print(f"[info]Debug: {message}[/info]")
+
+    async def _send(self, method: str, endpoint: str, **kwargs) -> httpx.Response:
+        """Make an API request and translate HTTP errors."""
+        if self._client is None:
+            raise RuntimeError("AsyncMoltbookAPI must be used as an async context manager")
+
+        self.debug(f"{method} {BASE_URL}{endpoint}")
+        if "json" in kwargs:
+            self.debug(f"Payload: {kwargs['json']}")
+
+        try:
+            response = await self._client.request(method, endpoint, **kwargs)
+            self.debug(f"Response Status: {response.status_code} ({response.http_version})")
+            response.raise_for_status()
+            return response
+
+        except httpx.HTTPStatusError as e:
+            try:
+                error_data = orjson.loads(e.response.content)
+                error_msg = error_data.get("error", str(e))
+                hint = error_data.get("hint", "")
+                if hint:
+                    error_msg += f"\n[info]Hint: {hint}[/info]"
+                raise Exception(error_msg) from e
+            except orjson.JSONDecodeError:
+                self.debug(f"Raw Error Response: {e.response.text}")
+                raise Exception(f"Request failed with status {e.response.status_code}") from e
+        except httpx.HTTPError as e:
+            raise Exception(f"Request failed: {e}") from e
+
+    async def _request[T: BaseModel](self, Cls: type[T], method: str, endpoint: str, **kwargs) -> T:
+        """Make an API request."""
+        response = await self._send(method, endpoint, **kwargs)
+        return Cls.model_validate_json(response.content)
+
+    async def _request_raw(self, method: str, endpoint: str, **kwargs) -> bytes:
+        """Make an API request and return the undecoded response body."""
+        response = await self._send(method, endpoint, **kwargs)
+        return response.content
+
+    async def _upload(self, endpoint: str, file_path: str, fields: dict[str, str] | None = None) -> bytes:
+        """Upload a file as multipart form data, reading it off the event loop."""
+        content_type = mimetypes.guess_type(file_path)[0] or "application/octet-stream"
+        path = Path(file_path)
+        content = await asyncio.to_thread(path.read_bytes)
+        return await self._request_raw(
+            "POST", endpoint, files={"file": (path.name, content, content_type)}, data=fields
+        )
+
+    # Registration
+    async def register(self, name: str, description: str) -> RegisterResponse:
+        return await self._request(
+            RegisterResponse,
+            "POST",
+            "/agents/register",
+            json={"name": name, "description": description},
+        )
+
+    async def check_status(self) -> Status:
+        return await self._request(Status, "GET", "/agents/status")
+
+    # Posts
+    async def create_post(
+        self,
+        submolt: str,
+        title: str,
+        content: str | None = None,
+        url: str | None = None,
+    ) -> bytes:
+        data = {"submolt": submolt, "title": title}
+        if content:
+            data["content"] = content
+        if url:
+            data["url"] = url
+        return await self._request_raw("POST", "/posts", json=data)
+
+    async def get_feed(self, sort: SortOrder = "hot", limit: int = 25, submolt: str | None = None) -> Feed:
+        params = {"sort": sort, "limit": limit}
+        if submolt:
+            params["submolt"] = submolt
+        return await self._request(Feed, "GET", "/posts", params=params)
+
+    async def get_feed_raw(self, sort: SortOrder = "hot", limit: int = 25, submolt: str | None = None) -> bytes:
+        params = {"sort": sort, "limit": limit}
+        if submolt:
+            params["submolt"] = submolt
+        return await self._request_raw("GET", "/posts", params=params)
+
+    async def get_post(self, post_id: str) -> Post:
+        post_id = extract_id(post_id)
+        return await self._request(Post, "GET", f"/posts/{post_id}")
+
+    async def delete_post(self, post_id: str) -> bytes:
+        post_id = extract_id(post_id)
+        return await self._request_raw("DELETE", f"/posts/{post_id}")
+
+    # Comments
+    async def add_comment(self, post_id: str, content: str, parent_id: str | None = None) -> bytes:
+        post_id = extract_id(post_id)
+        data = {"content": content}
+        if parent_id:
+            data["parent_id"] = extract_id(parent_id, kind="comment")
+        return await self._request_raw("POST", f"/posts/{post_id}/comments", json=data)
+
+    async def get_comments(self, post_id: str, sort: CommentSort = "top") -> PostComment:
+        post_id = extract_id(post_id)
+        return await self._request(PostComment, "GET", f"/posts/{post_id}/comments", params={"sort": sort})
+
+    async def get_feed_with_comments(
+        self,
+        sort: SortOrder = "hot",
+        limit: int = 25,
+        submolt: str | None = None,
+        concurrency: int = 5,
+    ) -> list[tuple[PostContent, PostComment]]:
+        """Get a feed along with the comments of every post, fetching comments concurrently."""
+        feed = await self.get_feed(sort, limit, submolt)
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def fetch(post: PostContent) -> PostComment:
+            async with semaphore:
+                return await self.get_comments(post.id)
+
+        comments = await asyncio.gather(*(fetch(post) for post in feed.posts))
+        return list(zip(feed.posts, comments))
+
+    # Voting
+    async def upvote_post(self, post_id: str) -> bytes:
+        post_id = extract_id(post_id)
+        return await self._request_raw("POST", f"/posts/{post_id}/upvote")
+
+    async def downvote_post(self, post_id: str) -> bytes:
+        post_id = extract_id(post_id)
+        return await self._request_raw("POST", f"/posts/{post_id}/downvote")
+
+    async def upvote_comment(self, comment_id: str) -> bytes:
+        comment_id = extract_id(comment_id, kind="comment")
+        return await self._request_raw("POST", f"/comments/{comment_id}/upvote")
+
+    # Submolts
+    async def create_submolt(self, name: str, display_name: str, description: str) -> bytes:
+        data = {"name": name, "display_name": display_name, "description": description}
+        return await self._request_raw("POST", "/submolts", json=data)
+
+    async def list_submolts(self) -> bytes:
+        return await self._request_raw("GET", "/submolts")
+
+    async def get_submolt(self, name: str) -> bytes:
+        return await self._request_raw("GET", f"/submolts/{name}")
+
+    async def subscribe_submolt(self, name: str) -> bytes:
+        return await self._request_raw("POST", f"/submolts/{name}/subscribe")
+
+    async def unsubscribe_submolt(self, name: str) -> bytes:
+        return await self._request_raw("DELETE", f"/submolts/{name}/subscribe")
+
+    # Following
+    async def follow_molty(self, agent_name: str) -> bytes:
+        return await self._request_raw("POST", f"/agents/{agent_name}/follow")
+
+    async def unfollow_molty(self, agent_name: str) -> bytes:
+        return await self._request_raw("DELETE", f"/agents/{agent_name}/follow")
+
+    # Feed
+    async def get_personalized_feed(self, sort: SortOrder = "hot", limit: int = 25) -> Feed:
+        return await self._request(Feed, "GET", "/feed", params={"sort": sort, "limit": limit})
+
+    async def get_personalized_feed_raw(self, sort: SortOrder = "hot", limit: int = 25) -> bytes:
+        return await self._request_raw("GET", "/feed", params={"sort": sort, "limit": limit})
+
+    # Search
+    async def search(self, query: str, search_type: SearchType = "all", limit: int = 20) -> bytes:
+        params = {"q": query, "type": search_type, "limit": limit}
+        return await self._request_raw("GET", "/search", params=params)
+
+    # Profile
+    async def get_profile(self) -> bytes:
+        return await self._request_raw("GET", "/agents/me")
+
+    async def get_agent_profile(self, agent_name: str) -> bytes:
+        return await self._request_raw("GET", "/agents/profile", params={"name": agent_name})
+
+    async def update_profile(self, description: str | None = None, metadata: str | None = None) -> bytes:
+        data = {}
+        if description:
+            data["description"] = description
+        if metadata:
+            data["metadata"] = metadata
+        return await self._request_raw("PATCH", "/agents/me", json=data)
+
+    async def upload_avatar(self, file_path: str) -> bytes:
+        return await self._upload("/agents/me/avatar", file_path)
+
+    async def remove_avatar(self) -> bytes:
+        return await self._request_raw("DELETE", "/agents/me/avatar")
+
+    # Moderation
+    async def pin_post(self, post_id: str) -> bytes:
+        post_id = extract_id(post_id)
+        return await self._request_raw("POST", f"/posts/{post_id}/pin")
+
+    async def unpin_post(self, post_id: str) -> bytes:
+        post_id = extract_id(post_id)
+        return await self._request_raw("DELETE", f"/posts/{post_id}/pin")
+
+    async def update_submolt_settings(
+        self,
+        submolt_name: str,
+        description: str | None = None,
+        banner_color: str | None = None,
+        theme_color: str | None = None,
+    ) -> bytes:
+        data = {}
+        if description:
+            data["description"] = description
+        if banner_color:
+            data["banner_color"] = banner_color
+        if theme_color:
+            data["theme_color"] = theme_color
+        return await self._request_raw("PATCH", f"/submolts/{submolt_name}/settings", json=data)
+
+    async def upload_submolt_avatar(self, submolt_name: str, file_path: str) -> bytes:
+        return await self._upload(f"/submolts/{submolt_name}/settings", file_path, {"type": "avatar"})
+
+    async def upload_submolt_banner(self, submolt_name: str, file_path: str) -> bytes:
+        return await self._upload(f"/submolts/{submolt_name}/settings", file_path, {"type": "banner"})
+
+    async def add_moderator(self, submolt_name: str, agent_name: str) -> bytes:
+        return await self._request_raw(
+            "POST",
+            f"/submolts/{submolt_name}/moderators",
+            json={"agent_name": agent_name, "role": "moderator"},
+        )
+
+    async def remove_moderator(self, submolt_name: str, agent_name: str) -> bytes:
+        return await self._request_raw(
+            "DELETE",
+            f"/submolts/{submolt_name}/moderators",
+            json={"agent_name": agent_name},
+        )
+
+    async def list_moderators(self, submolt_name: str) -> bytes:
+        return await self._request_raw("GET", f"/submolts/{submolt_name}/moderators")
+
+    # DMs
+    async def check_dms(self) -> bytes:
+        return await self._request_raw("GET", "/agents/dm/check")
+
+    async def list_dm_requests(self) -> bytes:
+        return await self._request_raw("GET", "/agents/dm/requests")
+
+    async def approve_dm_request(self, conversation_id: str) -> bytes:
+        return await self._request_raw("POST", f"/agents/dm/requests/{conversation_id}/approve")
+
+    async def list_conversations(self) -> bytes:
+        return await self._request_raw("GET", "/agents/dm/conversations")
+
+    async def get_conversation(self, conversation_id: str) -> bytes:
+        return await self._request_raw("GET", f"/agents/dm/conversations/{conversation_id}")
+
+    async def send_dm(self, conversation_id: str, message: str) -> bytes:
+        return await self._request_raw(
+            "POST",
+            f"/agents/dm/conversations/{conversation_id}/send",
+            json={"message": message},
+        )
+
+    async def request_dm(self, to_agent: str, message: str) -> bytes:
+        return await self._request_raw("POST", "/agents/dm/request", json={"to": to_agent, "message": message})
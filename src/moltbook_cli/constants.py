@@ -1,4 +1,5 @@
 from pathlib import Path
+from typing import Literal
 
 # Configuration
 CONFIG_DIR = Path.home() / ".config" / "moltbook"
@@ -6,3 +7,13 @@ CONFIG_FILE = CONFIG_DIR / "credentials.json"
 
 # API
 BASE_URL = "https://www.moltbook.com/api/v1"
+
+# Read-only responses are cached in memory for this many seconds
+CACHE_TTL = 30
+CACHE_MAXSIZE = 256
+
+# Accepted values for sort and search options. The CLI validates these at
+# parse time; the API clients use them for type checking only.
+SortOrder = Literal["hot", "new", "top", "rising"]
+CommentSort = Literal["top", "new", "controversial"]
+SearchType = Literal["posts", "comments", "all"]
@@ -1,58 +1,123 @@
-import json
+from __future__ import annotations
+
+import functools
+import inspect
 import sys
-from enum import StrEnum
-from importlib.metadata import PackageNotFoundError, version
+from collections.abc import Callable
+from typing import TYPE_CHECKING
 
+import orjson
 import typer
-from rich.console import Console
-from rich.markdown import Markdown
-from rich.prompt import Prompt
-from rich.syntax import Syntax
+from rich.style import Style
 from rich.theme import Theme
-from rich.tree import Tree
+from typer.models import ArgumentInfo
+
+from .constants import CONFIG_FILE, CommentSort, SearchType, SortOrder
+
+# Only imported where used so that --help and --version stay fast
+if TYPE_CHECKING:
+    from pygments.lexer import Lexer
+    from rich.console import Console
+    from rich.syntax import SyntaxTheme
+    from rich.tree import Tree
 
-from .api import MoltbookAPI
-from .constants import CONFIG_FILE
-from .models.post import Comment, Feed, PostComment
+    from .api import MoltbookAPI
+    from .models.post import Comment, Feed, PostComment
 
-# Custom Rich Theme
+# Custom Rich Theme, built from Style objects so Rich doesn't parse style strings
 molt_theme = Theme(
     {
-        "info": "cyan",
-        "warning": "yellow",
-        "error": "bold red",
-        "success": "bold green",
-        "molt": "bold dark_orange",
+        "info": Style(color="cyan"),
+        "warning": Style(color="yellow"),
+        "error": Style(color="red", bold=True),
+        "success": Style(color="green", bold=True),
+        "molt": Style(color="dark_orange", bold=True),
     }
 )
 
-console = Console(theme=molt_theme)
 app = typer.Typer(
     help="Moltbook CLI - The social network for AI agents",
     rich_markup_mode="rich",
     no_args_is_help=True,
 )
-api = MoltbookAPI(console)
+
+
+@functools.cache
+def get_console() -> Console:
+    """Create the console on first use, so terminal detection only runs for commands that print."""
+    from rich.console import Console
+
+    return Console(theme=molt_theme)
+
+
+# Set by the --verbose callback option, before any command creates the client
+_verbose = False
+
+
+@functools.cache
+def get_api() -> MoltbookAPI:
+    """Create the API client on first use rather than at import time."""
+    # requests and urllib3 come in with the client, so --help and --version skip them
+    from .api import MoltbookAPI
+
+    return MoltbookAPI(get_console(), verbose=_verbose)
+
+
+def close_api() -> None:
+    """Close the API client, if a command created one."""
+    if get_api.cache_info().currsize:
+        get_api().close()
+
+
+@functools.cache
+def _pkg_version() -> str | None:
+    """Look up the installed package version once, since it scans distribution metadata."""
+    from importlib.metadata import PackageNotFoundError, version
+
+    try:
+        return version("moltbook-cli")
+    except PackageNotFoundError:
+        return None
 
 
 def version_callback(value: bool):
     if value:
-        try:
-            pkg_version = version("moltbook-cli")
-            console.print(f"moltbook-cli: [molt]{pkg_version}[/molt]")
-        except PackageNotFoundError:
-            console.print("moltbook-cli: [warning]unknown[/warning]")
+        pkg_version = _pkg_version()
+        if pkg_version is not None:
+            get_console().print(f"moltbook-cli: [molt]{pkg_version}[/molt]")
+        else:
+            get_console().print("moltbook-cli: [warning]unknown[/warning]")
         raise typer.Exit()
 
 
-def print_json(json_str: str):
-    """Print JSON with syntax highlighting."""
-    formatted_json = json.dumps(json.loads(json_str), indent=2, ensure_ascii=False)
-    syntax = Syntax(formatted_json, "json", theme="monokai", background_color="default")
-    console.print(syntax)
+@functools.cache
+def _json_highlighting() -> tuple[Lexer, SyntaxTheme]:
+    """Resolve the Pygments JSON lexer and monokai theme once per process."""
+    from pygments.lexers import get_lexer_by_name
+    from rich.syntax import PygmentsSyntaxTheme
+
+    # Same lexer options Syntax uses when given a lexer name
+    return get_lexer_by_name("json", stripnl=False, ensurenl=True, tabsize=4), PygmentsSyntaxTheme("monokai")
+
+
+def print_json(raw: bytes):
+    """Print a raw JSON response body, with syntax highlighting on a terminal."""
+    formatted = orjson.dumps(orjson.loads(raw), option=orjson.OPT_INDENT_2)
+    # Piped output (e.g. into jq) gets the plain bytes, skipping Pygments and Rich rendering
+    if not get_console().is_terminal:
+        sys.stdout.buffer.write(formatted + b"\n")
+        sys.stdout.flush()
+        return
+
+    from rich.syntax import Syntax
+
+    lexer, theme = _json_highlighting()
+    syntax = Syntax(formatted.decode(), lexer, theme=theme, background_color="default")
+    get_console().print(syntax)
 
 
 def print_feed(feed: Feed):
+    console = get_console()
     for post in feed.posts:
         console.print(post.id)
         console.print(
@@ -70,7 +135,7 @@ def print_feed(feed: Feed):
 
 
 def add_comment_to_tree(tree: Tree, comment: Comment, console: Console, level: int = 0) -> None:
-    content_markdown = Markdown(comment.content)
+    from rich.markdown import Markdown
 
     with console.capture() as capture:
         content_markdown = Markdown(comment.content)
@@ -92,30 +157,47 @@ def add_comment_to_tree(tree: Tree, comment: Comment, console: Console, level: i
 
 
 def print_comments(comments: PostComment):
+    from rich.tree import Tree
+
     tree = Tree(f"[bold underline]{comments.post_title}[/]")
 
     for comment in comments.comments:
-        add_comment_to_tree(tree, comment, console)
+        add_comment_to_tree(tree, comment, get_console())
 
-    console.print(tree)
+    get_console().print(tree)
 
 
 def read_pipe() -> str:
     if sys.stdin.isatty():
-        console.print("[error]Error:[/error] Content is required when not piping from stdin")
-        raise typer.Exit(1)
+        get_console().print("[error]Error:[/error] Content is required when not piping from stdin")
+        raise SystemExit(1)
+
+    # Read the raw pipe in one go and decode once, bypassing the text wrapper.
+    # Newlines are still normalised the way text-mode stdin would.
+    return sys.stdin.buffer.read().decode("utf-8", errors="replace").replace("\r\n", "\n")
 
-    content = sys.stdin.read()
 
-    if not isinstance(content, str):
-        console.print("[error]Error:[/error] Content is not string")
-        raise typer.Exit(1)
+def safe_command[**P](fn: Callable[P, bytes | None]) -> Callable[P, None]:
+    """Print a command's raw JSON result, reporting any error instead of raising.
+
+    Commands that render their own output return None.
+    """
+
+    @functools.wraps(fn)
+    def wrapper(*args: P.args, **kwargs: P.kwargs) -> None:
+        try:
+            result = fn(*args, **kwargs)
+            if result is not None:
+                print_json(result)
+        except Exception as e:
+            get_console().print(f"[error]Error:[/error] {e}")
 
-    return content
+    return wrapper
 
 
 @app.callback()
 def main(
+    ctx: typer.Context,
     verbose: bool = typer.Option(False, "--verbose", "-v", help="Enable verbose output"),
     version: bool | None = typer.Option(
         None,
@@ -128,54 +210,44 @@ def main(
     """
     Moltbook CLI - The social network for AI agents
     """
-    api.verbose = verbose
-
-
-# Enums for CLI choices
-class SortOrder(StrEnum):
-    hot = "hot"
-    new = "new"
-    top = "top"
-    rising = "rising"
+    # Only record the flag here: Click runs this callback even for a subcommand's
+    # --help or a bad option value, which should not read credentials or open a session
+    global _verbose
+    _verbose = verbose
+    if get_api.cache_info().currsize:
+        get_api().verbose = verbose
+    ctx.call_on_close(close_api)
 
 
-class CommentSort(StrEnum):
-    top = "top"
-    new = "new"
-    controversial = "controversial"
-
-
-class SearchType(StrEnum):
-    posts = "posts"
-    comments = "comments"
-    all = "all"
+# Arguments shared by several commands, built once rather than per command
+_POST_ID = typer.Argument(..., help="Post ID or URL")
+_COMMENT_ID = typer.Argument(..., help="Comment ID or URL")
+_CONV_ID = typer.Argument(..., help="Conversation ID")
 
 
 # --- CLI Commands ---
 
 
 @app.command()
+@safe_command
 def register(name: str, description: str):
     """Register a new agent."""
-    try:
-        result = api.register(name, description)
-        console.print(f"\n[success]✓ Credentials saved to {CONFIG_FILE}[/success]")
-        console.print(f"[info]✓ Claim URL:[/info] {result.agent.claim_url}")
-        console.print(f"[info]✓ Verification code:[/info] {result.agent.verification_code}")
-    except Exception as e:
-        console.print(f"[error]Error:[/error] {e}")
+    console = get_console()
+    result = get_api().register(name, description)
+    console.print(f"\n[success]✓ Credentials saved to {CONFIG_FILE}[/success]")
+    console.print(f"[info]✓ Claim URL:[/info] {result.agent.claim_url}")
+    console.print(f"[info]✓ Verification code:[/info] {result.agent.verification_code}")
 
 
 @app.command()
+@safe_command
 def status():
     """Check claim status."""
-    try:
-        result = api.check_status()
-        console.print(f"[info]Status:[/info] {result.status}")
-        console.print(f"[info]ID:[/info] {result.agent.id}")
-        console.print(f"[info]Name:[/info] {result.agent.name}")
-    except Exception as e:
-        console.print(f"[error]Error:[/error] {e}")
+    console = get_console()
+    result = get_api().check_status()
+    console.print(f"[info]Status:[/info] {result.status}")
+    console.print(f"[info]ID:[/info] {result.agent.id}")
+    console.print(f"[info]Name:[/info] {result.agent.name}")
 
 
 # Post Group
@@ -184,6 +256,7 @@ app.add_typer(post_app, name="post")
 
 
 @post_app.command("create")
+@safe_command
 def post_create(
     submolt: str = typer.Option(default="general", help="Submolt name"),
     title: str | None = typer.Option(None, help="Post title"),
@@ -193,6 +266,8 @@ def post_create(
 ):
     """Create a new post. Content can be piped from stdin."""
     if interactive:
+        from rich.prompt import Prompt
+
         submolt = Prompt.ask("Submolt name", default="general")
         title = Prompt.ask("Post title")
         content = Prompt.ask("Post content", default="")
@@ -203,83 +278,78 @@ def post_create(
         content = read_pipe()
 
     if title is None:
-        console.print("[error]Error:[/error] Title is required")
-        raise typer.Exit(1)
+        get_console().print("[error]Error:[/error] Title is required")
+        raise SystemExit(1)
 
-    try:
-        print_json(api.create_post(submolt, title, content, url))
-    except Exception as e:
-        console.print(f"[error]Error:[/error] {e}")
+    return get_api().create_post(submolt, title, content, url)
 
 
 @post_app.command("get")
-def post_get(post_id: str = typer.Argument(..., help="Post ID or URL")):
+@safe_command
+def post_get(post_id: str = _POST_ID):
     """Get a single post."""
-    try:
-        result = api.get_post(post_id)
-        content_markdown = Markdown(result.post.content)
-        console.print(
-            f"[dim]m/{result.post.submolt.name}, posted by u/{result.post.author.name} "
-            f"at {result.post.created_at}[/dim]",
-            highlight=False,
-        )
-        console.print(
-            f"[red]{result.post.upvotes} upvotes[/red] [blue]{result.post.downvotes} downvotes[/blue] "
-            f"[molt]{result.post.comment_count} comments[/molt]",
-            highlight=False,
-        )
-        console.print(f"[bold]{result.post.title}[/bold]", highlight=False)
-
-        console.print()
-        console.print(content_markdown)
-    except Exception as e:
-        console.print(f"[error]Error:[/error] {e}")
+    from rich.markdown import Markdown
+
+    console = get_console()
+    result = get_api().get_post(post_id)
+    content_markdown = Markdown(result.post.content)
+    console.print(
+        f"[dim]m/{result.post.submolt.name}, posted by u/{result.post.author.name} at {result.post.created_at}[/dim]",
+        highlight=False,
+    )
+    console.print(
+        f"[red]{result.post.upvotes} upvotes[/red] [blue]{result.post.downvotes} downvotes[/blue] "
+        f"[molt]{result.post.comment_count} comments[/molt]",
+        highlight=False,
+    )
+    console.print(f"[bold]{result.post.title}[/bold]", highlight=False)
+
+    console.print()
+    console.print(content_markdown)
 
 
 @post_app.command("delete")
-def post_delete(post_id: str = typer.Argument(..., help="Post ID or URL")):
+@safe_command
+def post_delete(post_id: str = _POST_ID):
     """Delete a post."""
-    try:
-        print_json(api.delete_post(post_id))
-    except Exception as e:
-        console.print(f"[error]Error:[/error] {e}")
+    return get_api().delete_post(post_id)
 
 
 @post_app.command("upvote")
-def post_upvote(post_id: str = typer.Argument(..., help="Post ID or URL")):
+@safe_command
+def post_upvote(post_id: str = _POST_ID):
     """Upvote a post."""
-    try:
-        print_json(api.upvote_post(post_id))
-    except Exception as e:
-        console.print(f"[error]Error:[/error] {e}")
+    return get_api().upvote_post(post_id)
 
 
 @post_app.command("downvote")
-def post_downvote(post_id: str = typer.Argument(..., help="Post ID or URL")):
+@safe_command
+def post_downvote(post_id: str = _POST_ID):
     """Downvote a post."""
-    try:
-        print_json(api.downvote_post(post_id))
-    except Exception as e:
-        console.print(f"[error]Error:[/error] {e}")
+    return get_api().downvote_post(post_id)
 
 
 @app.command()
+@safe_command
 def feed(
-    sort: SortOrder = typer.Option(SortOrder.hot, help="Sort order"),
+    sort: SortOrder = typer.Option("hot", help="Sort order"),
     limit: int = typer.Option(25, help="Number of posts"),
     submolt: str | None = typer.Option(None, help="Filter by submolt"),
     personalized: bool = typer.Option(False, "--personalized", help="Get personalized feed"),
+    as_json: bool = typer.Option(False, "--json", help="Print the raw JSON response"),
 ):
     """Get feed of posts."""
-    try:
-        if personalized:
-            feed = api.get_personalized_feed(sort.value, limit)
-        else:
-            feed = api.get_personalized_feed(sort.value, limit)
+    api = get_api()
+    # The raw body goes straight to print_json, skipping model validation
+    if as_json:
+        return api.get_personalized_feed_raw(sort, limit) if personalized else api.get_feed_raw(sort, limit, submolt)
+
+    if personalized:
+        feed = api.get_personalized_feed(sort, limit)
+    else:
+        feed = api.get_feed(sort, limit, submolt)
 
-        print_feed(feed)
-    except Exception as e:
-        console.print(f"[error]Error:[/error] {e}")
+    print_feed(feed)
 
 
 # Comment Group
@@ -288,46 +358,42 @@ app.add_typer(comment_app, name="comment")
 
 
 @comment_app.command("add")
+@safe_command
 def comment_add(
-    post_id: str = typer.Argument(..., help="Post ID or URL"),
+    post_id: str = _POST_ID,
     content: str | None = typer.Argument(None, help="Comment content (can be piped from stdin)"),
     parent_id: str | None = typer.Option(None, help="Parent comment ID or URL (for replies)"),
     interactive: bool = typer.Option(False, "--interactive", "-i", help="Interactive mode"),
 ):
     """Add a comment to a post. Content can be piped from stdin."""
     if interactive:
+        from rich.prompt import Prompt
+
         parent_id = Prompt.ask("Parent comment ID or URL (for replies)", default="")
         content = Prompt.ask("Post content", default="")
     # Read from stdin if content not provided and stdin is piped
     elif content is None:
         content = read_pipe()
 
-    try:
-        print_json(api.add_comment(post_id, content, parent_id))
-    except Exception as e:
-        console.print(f"[error]Error:[/error] {e}")
+    return get_api().add_comment(post_id, content, parent_id)
 
 
 @comment_app.command("get")
+@safe_command
 def comment_get(
-    post_id: str = typer.Argument(..., help="Post ID or URL"),
-    sort: CommentSort = typer.Option(CommentSort.top, help="Sort order"),
+    post_id: str = _POST_ID,
+    sort: CommentSort = typer.Option("top", help="Sort order"),
 ):
     """Get comments on a post."""
-    try:
-        result = api.get_comments(post_id, sort.value)
-        print_comments(result)
-    except Exception as e:
-        console.print(f"[error]Error:[/error] {e}")
+    result = get_api().get_comments(post_id, sort)
+    print_comments(result)
 
 
 @comment_app.command("upvote")
-def comment_upvote(comment_id: str = typer.Argument(..., help="Comment ID or URL")):
+@safe_command
+def comment_upvote(comment_id: str = _COMMENT_ID):
     """Upvote a comment."""
-    try:
-        print_json(api.upvote_comment(comment_id))
-    except Exception as e:
-        console.print(f"[error]Error:[/error] {e}")
+    return get_api().upvote_comment(comment_id)
 
 
 # Submolt Group
@@ -336,48 +402,38 @@ app.add_typer(submolt_app, name="submolt")
 
 
 @submolt_app.command("create")
+@safe_command
 def submolt_create(name: str, display_name: str, description: str):
     """Create a submolt."""
-    try:
-        print_json(api.create_submolt(name, display_name, description))
-    except Exception as e:
-        console.print(f"[error]Error:[/error] {e}")
+    return get_api().create_submolt(name, display_name, description)
 
 
 @submolt_app.command("list")
+@safe_command
 def submolt_list():
     """List all submolts."""
-    try:
-        print_json(api.list_submolts())
-    except Exception as e:
-        console.print(f"[error]Error:[/error] {e}")
+    return get_api().list_submolts()
 
 
 @submolt_app.command("get")
+@safe_command
 def submolt_get(name: str):
     """Get submolt info."""
-    try:
-        print_json(api.get_submolt(name))
-    except Exception as e:
-        console.print(f"[error]Error:[/error] {e}")
+    return get_api().get_submolt(name)
 
 
 @submolt_app.command("subscribe")
+@safe_command
 def submolt_subscribe(name: str):
     """Subscribe to a submolt."""
-    try:
-        print_json(api.subscribe_submolt(name))
-    except Exception as e:
-        console.print(f"[error]Error:[/error] {e}")
+    return get_api().subscribe_submolt(name)
 
 
 @submolt_app.command("unsubscribe")
+@safe_command
 def submolt_unsubscribe(name: str):
     """Unsubscribe from a submolt."""
-    try:
-        print_json(api.unsubscribe_submolt(name))
-    except Exception as e:
-        console.print(f"[error]Error:[/error] {e}")
+    return get_api().unsubscribe_submolt(name)
 
 
 # Follow Group
@@ -386,34 +442,28 @@ app.add_typer(follow_app, name="follow")
 
 
 @follow_app.command("add")
+@safe_command
 def follow_add(agent_name: str):
     """Follow a molty."""
-    try:
-        print_json(api.follow_molty(agent_name))
-    except Exception as e:
-        console.print(f"[error]Error:[/error] {e}")
+    return get_api().follow_molty(agent_name)
 
 
 @follow_app.command("remove")
+@safe_command
 def follow_remove(agent_name: str):
     """Unfollow a molty."""
-    try:
-        print_json(api.unfollow_molty(agent_name))
-    except Exception as e:
-        console.print(f"[error]Error:[/error] {e}")
+    return get_api().unfollow_molty(agent_name)
 
 
 @app.command()
+@safe_command
 def search(
     query: str,
-    type: SearchType = typer.Option(SearchType.all, help="Search type"),
+    type: SearchType = typer.Option("all", help="Search type"),
     limit: int = typer.Option(20, help="Number of results"),
 ):
     """Semantic search."""
-    try:
-        print_json(api.search(query, type.value, limit))
-    except Exception as e:
-        console.print(f"[error]Error:[/error] {e}")
+    return get_api().search(query, type, limit)
 
 
 # Profile Group
@@ -422,52 +472,42 @@ app.add_typer(profile_app, name="profile")
 
 
 @profile_app.command("get")
+@safe_command
 def profile_get():
     """Get your profile."""
-    try:
-        print_json(api.get_profile())
-    except Exception as e:
-        console.print(f"[error]Error:[/error] {e}")
+    return get_api().get_profile()
 
 
 @profile_app.command("view")
+@safe_command
 def profile_view(agent_name: str):
     """View another molty's profile."""
-    try:
-        print_json(api.get_agent_profile(agent_name))
-    except Exception as e:
-        console.print(f"[error]Error:[/error] {e}")
+    return get_api().get_agent_profile(agent_name)
 
 
 @profile_app.command("update")
+@safe_command
 def profile_update(
     description: str | None = typer.Option(None, help="New description"),
     metadata: str | None = typer.Option(None, help="Metadata as JSON string"),
 ):
     """Update your profile."""
-    try:
-        meta_dict = json.loads(metadata) if metadata else None
-        print_json(api.update_profile(description, meta_dict))
-    except Exception as e:
-        console.print(f"[error]Error:[/error] {e}")
+    meta_dict = orjson.loads(metadata) if metadata else None
+    return get_api().update_profile(description, meta_dict)
 
 
 @profile_app.command("avatar-upload")
+@safe_command
 def profile_avatar_upload(file_path: str):
     """Upload avatar."""
-    try:
-        print_json(api.upload_avatar(file_path))
-    except Exception as e:
-        console.print(f"[error]Error:[/error] {e}")
+    return get_api().upload_avatar(file_path)
 
 
 @profile_app.command("avatar-remove")
+@safe_command
 def profile_avatar_remove():
     """Remove avatar."""
-    try:
-        print_json(api.remove_avatar())
-    except Exception as e:
-        console.print(f"[error]Error:[/error] {e}")
+    return get_api().remove_avatar()
 
 
 # Moderation Group
@@ -476,24 +516,21 @@ app.add_typer(mod_app, name="mod")
 
 
 @mod_app.command("pin")
-def mod_pin(post_id: str = typer.Argument(..., help="Post ID or URL")):
+@safe_command
+def mod_pin(post_id: str = _POST_ID):
     """Pin a post."""
-    try:
-        print_json(api.pin_post(post_id))
-    except Exception as e:
-        console.print(f"[error]Error:[/error] {e}")
+    return get_api().pin_post(post_id)
 
 
 @mod_app.command("unpin")
-def mod_unpin(post_id: str = typer.Argument(..., help="Post ID or URL")):
+@safe_command
+def mod_unpin(post_id: str = _POST_ID):
     """Unpin a post."""
-    try:
-        print_json(api.unpin_post(post_id))
-    except Exception as e:
-        console.print(f"[error]Error:[/error] {e}")
+    return get_api().unpin_post(post_id)
 
 
 @mod_app.command("settings")
+@safe_command
 def mod_settings(
     submolt_name: str,
     description: str | None = typer.Option(None, help="New description"),
@@ -501,55 +538,42 @@ def mod_settings(
     theme_color: str | None = typer.Option(None, help="Theme color (hex)"),
 ):
     """Update submolt settings."""
-    try:
-        print_json(api.update_submolt_settings(submolt_name, description, banner_color, theme_color))
-    except Exception as e:
-        console.print(f"[error]Error:[/error] {e}")
+    return get_api().update_submolt_settings(submolt_name, description, banner_color, theme_color)
 
 
 @mod_app.command("avatar-upload")
+@safe_command
 def mod_avatar_upload(submolt_name: str, file_path: str):
     """Upload submolt avatar."""
-    try:
-        print_json(api.upload_submolt_avatar(submolt_name, file_path))
-    except Exception as e:
-        console.print(f"[error]Error:[/error] {e}")
+    return get_api().upload_submolt_avatar(submolt_name, file_path)
 
 
 @mod_app.command("banner-upload")
+@safe_command
 def mod_banner_upload(submolt_name: str, file_path: str):
     """Upload submolt banner."""
-    try:
-        print_json(api.upload_submolt_banner(submolt_name, file_path))
-    except Exception as e:
-        console.print(f"[error]Error:[/error] {e}")
+    return get_api().upload_submolt_banner(submolt_name, file_path)
 
 
 @mod_app.command("mod-add")
+@safe_command
 def mod_add(submolt_name: str, agent_name: str):
     """Add a moderator."""
-    try:
-        print_json(api.add_moderator(submolt_name, agent_name))
-    except Exception as e:
-        console.print(f"[error]Error:[/error] {e}")
+    return get_api().add_moderator(submolt_name, agent_name)
 
 
 @mod_app.command("mod-remove")
+@safe_command
 def mod_remove(submolt_name: str, agent_name: str):
     """Remove a moderator."""
-    try:
-        print_json(api.remove_moderator(submolt_name, agent_name))
-    except Exception as e:
-        console.print(f"[error]Error:[/error] {e}")
+    return get_api().remove_moderator(submolt_name, agent_name)
 
 
 @mod_app.command("mod-list")
+@safe_command
 def mod_list(submolt_name: str):
     """List moderators."""
-    try:
-        print_json(api.list_moderators(submolt_name))
-    except Exception as e:
-        console.print(f"[error]Error:[/error] {e}")
+    return get_api().list_moderators(submolt_name)
 
 
 # DM Group
@@ -558,73 +582,113 @@ app.add_typer(dm_app, name="dm")
 
 
 @dm_app.command("check")
+@safe_command
 def dm_check():
     """Check for pending requests and unread messages."""
-    try:
-        print_json(api.check_dms())
-    except Exception as e:
-        console.print(f"[error]Error:[/error] {e}")
+    return get_api().check_dms()
 
 
 @dm_app.command("requests")
+@safe_command
 def dm_requests():
     """List pending DM requests."""
-    try:
-        print_json(api.list_dm_requests())
-    except Exception as e:
-        console.print(f"[error]Error:[/error] {e}")
+    return get_api().list_dm_requests()
 
 
 @dm_app.command("approve")
-def dm_approve(conversation_id: str = typer.Argument(..., help="Conversation ID")):
+@safe_command
+def dm_approve(conversation_id: str = _CONV_ID):
     """Approve a DM request."""
-    try:
-        print_json(api.approve_dm_request(conversation_id))
-    except Exception as e:
-        console.print(f"[error]Error:[/error] {e}")
+    return get_api().approve_dm_request(conversation_id)
 
 
 @dm_app.command("conversations")
+@safe_command
 def dm_conversations():
     """List active DM conversations."""
-    try:
-        print_json(api.list_conversations())
-    except Exception as e:
-        console.print(f"[error]Error:[/error] {e}")
+    return get_api().list_conversations()
 
 
 @dm_app.command("get")
-def dm_get(conversation_id: str = typer.Argument(..., help="Conversation ID")):
+@safe_command
+def dm_get(conversation_id: str = _CONV_ID):
     """Get messages from a conversation."""
-    try:
-        print_json(api.get_conversation(conversation_id))
-    except Exception as e:
-        console.print(f"[error]Error:[/error] {e}")
+    return get_api().get_conversation(conversation_id)
 
 
 @dm_app.command("send")
+@safe_command
 def dm_send(
-    conversation_id: str = typer.Argument(..., help="Conversation ID"),
+    conversation_id: str = _CONV_ID,
     message: str = typer.Argument(..., help="Message content"),
 ):
     """Send a message in a conversation."""
-    try:
-        print_json(api.send_dm(conversation_id, message))
-    except Exception as e:
-        console.print(f"[error]Error:[/error] {e}")
+    return get_api().send_dm(conversation_id, message)
 
 
 @dm_app.command("request")
+@safe_command
 def dm_request(
     to: str = typer.Option(..., help="Agent name to request DM with"),
     message: str = typer.Option(..., help="Initial message"),
 ):
     """Request a new DM conversation."""
-    try:
-        print_json(api.request_dm(to, message))
-    except Exception as e:
-        console.print(f"[error]Error:[/error] {e}")
+    return get_api().request_dm(to, message)
 
 
-if __name__ == "__main__":
+def _is_required_str_argument(param: inspect.Parameter) -> bool:
+    """Whether a command parameter is a required positional string, needing no Click conversion."""
+    if param.annotation not in (str, "str"):
+        return False
+    default = param.default
+    return default is inspect.Parameter.empty or (isinstance(default, ArgumentInfo) and default.default is ...)
+
+
+def _fast_commands() -> dict[tuple[str, ...], tuple[Callable[..., None], int]]:
+    """Map every registered command that only takes required string arguments to its callback and argument count.
+
+    Built from the Typer registrations, so renamed commands or new options are picked up without
+    maintaining a second table. This reads the callbacks' signatures and does not build the Click tree.
+    """
+    apps: list[tuple[tuple[str, ...], typer.Typer]] = [((), app)]
+    apps += [
+        ((group.name,), group.typer_instance) for group in app.registered_groups if group.name and group.typer_instance
+    ]
+    table = {}
+    for prefix, typer_app in apps:
+        for command in typer_app.registered_commands:
+            callback = command.callback
+            if callback is None:
+                continue
+            # Same default naming as Typer
+            name = command.name or callback.__name__.lower().replace("_", "-")
+            params = inspect.signature(callback).parameters.values()
+            if all(_is_required_str_argument(param) for param in params):
+                table[(*prefix, name)] = (callback, len(params))
+    return table
+
+
+# run() calls these directly so the common invocations skip building the
+# Click command tree; anything else goes through Typer
+FAST_COMMANDS = _fast_commands()
+
+
+def run():
+    """Console entry point."""
+    args = sys.argv[1:]
+    # Options (including --help) and unknown commands are left to Typer
+    if not any(arg.startswith("-") for arg in args):
+        for depth in (2, 1):
+            entry = FAST_COMMANDS.get(tuple(args[:depth]))
+            if entry is not None and len(args) - depth == entry[1]:
+                command, _ = entry
+                try:
+                    command(*args[depth:])
+                finally:
+                    close_api()
+                return
     app()
+
+
+if __name__ == "__main__":
+    run()
@@ -1,7 +1,7 @@
-from uuid import UUID
-
 from pydantic import BaseModel
 
+from .common import UUIDStr
+
 
 class RegisterAgent(BaseModel):
     api_key: str
@@ -14,7 +14,7 @@ class RegisterResponse(BaseModel):
 
 
 class Agent(BaseModel):
-    id: UUID
+    id: UUIDStr
     name: str
 
 
@@ -0,0 +1,9 @@
+from typing import Annotated
+
+from pydantic import Field
+
+UUID_PATTERN = r"^[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}$"
+
+# IDs are kept as validated strings rather than uuid.UUID. Nothing needs
+# them as integers, and a feed carries several per post.
+UUIDStr = Annotated[str, Field(pattern=UUID_PATTERN)]
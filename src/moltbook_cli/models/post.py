@@ -1,22 +1,29 @@
 from datetime import datetime
 from typing import Self
-from uuid import UUID
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
+
+from .common import UUIDStr
 
 
 class Submolt(BaseModel):
-    id: UUID
+    model_config = ConfigDict(frozen=True)
+
+    id: UUIDStr
     name: str
 
 
 class Author(BaseModel):
-    id: UUID
+    model_config = ConfigDict(frozen=True)
+
+    id: UUIDStr
     name: str
 
 
 class PostContent(BaseModel):
-    id: UUID
+    model_config = ConfigDict(frozen=True)
+
+    id: UUIDStr
     title: str
     content: str
     url: str | None
@@ -29,12 +36,16 @@ class PostContent(BaseModel):
 
 
 class Post(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     success: bool
     post: PostContent
 
 
 class Comment(BaseModel):
-    id: UUID
+    model_config = ConfigDict(frozen=True)
+
+    id: UUIDStr
     content: str
     upvotes: int
     downvotes: int
@@ -44,13 +55,17 @@ class Comment(BaseModel):
 
 
 class PostComment(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     success: bool
-    post_id: UUID
+    post_id: UUIDStr
     post_title: str
     count: int
     comments: list[Comment]
 
 
 class Feed(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     success: bool
     posts: list[PostContent]